@@ -16,7 +16,16 @@
 #   limitations under the License.
 #
 # ------------------------------------------------------------------------------
-"""This module contains the data classes for the Hello World ABCI application."""
+"""
+This module contains the data classes for the Hello World ABCI application.
+
+Design note: the code here is control-flow glue (events, rounds and the
+transition table), invoked a constant number of times per block with no inner
+loops or numeric work. Performance work should therefore target interpreter
+overhead (attribute access, allocations, dispatch); JIT or vectorised
+approaches (e.g. Numba) do not apply, as their per-call overhead would
+outweigh any gain.
+"""
 
 from abc import ABC
 from enum import Enum
@@ -43,7 +52,7 @@ from packages.valory.skills.hello_world_abci.payloads import (
 )
 
 
-class Event(Enum):
+class Event(str, Enum):
     """Event enumeration for the Hello World ABCI demo."""
 
     DONE = "done"
@@ -51,6 +60,10 @@ class Event(Enum):
     NO_MAJORITY = "no_majority"
     RESET_TIMEOUT = "reset_timeout"
 
+    def __format__(self, format_spec: str) -> str:
+        """Format as `Event.DONE` on all Python versions, not as the raw value."""
+        return format(Enum.__str__(self), format_spec)
+
 
 class SynchronizedData(
     BaseSynchronizedData
@@ -64,16 +77,13 @@ class SynchronizedData(
     @property
     def print_count(self) -> int:
         """Get the print count."""
-        return cast(int, self.db.get("print_count", 0))
+        return self.db.get("print_count", 0)  # type: ignore[return-value]
 
     @property
     def printed_messages(self) -> List[str]:
         """Get the printed messages list."""
 
-        return cast(
-            List[str],
-            self.db.get_strict("printed_messages"),
-        )
+        return self.db.get_strict("printed_messages")
 
 
 class HelloWorldABCIAbstractRound(AbstractRound, ABC):
@@ -44,6 +44,7 @@ from packages.valory.skills.hello_world_abci.payloads import (
 from packages.valory.skills.hello_world_abci.rounds import (
     CollectRandomnessRound,
     Event,
+    HelloWorldAbciApp,
     PrintMessageRound,
     PrintNumberRound,
     RegistrationRound,
@@ -396,3 +397,19 @@ def test_synchronized_data() -> None:  # pylint:too-many-locals
     assert (
         abs(synchronized_data.keeper_randomness - actual_keeper_randomness) < 1e-10
     )  # avoid equality comparisons between floats
+
+
+def test_event() -> None:
+    """Test the str-based Event enumeration."""
+
+    assert all(isinstance(event, str) for event in Event)
+    assert Event.DONE == "done"
+    assert hash(Event.DONE) == hash("done")
+    assert str(Event.DONE) == f"{Event.DONE}" == "Event.DONE"
+
+    transition_function = HelloWorldAbciApp.transition_function
+    assert transition_function[RegistrationRound][Event.DONE] is CollectRandomnessRound
+    assert (
+        transition_function[SelectKeeperRound][Event.NO_MAJORITY] is RegistrationRound
+    )
+    assert HelloWorldAbciApp.event_to_timeout[Event.ROUND_TIMEOUT] == 30.0